@@ -0,0 +1,66 @@
+"""Persistent OCR result cache keyed by image content hash."""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional, Tuple
+
+from loguru import logger
+
+
+class OCRCache:
+    """SQLite-backed cache mapping image content hashes to OCR results.
+
+    Re-running the tool over a directory where only a few images changed
+    skips full OCR for every unchanged file; hashing is orders of magnitude
+    cheaper than tesseract.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        """Open (or create) the cache database at the given path."""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(cache_path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_cache ("
+            "hash BLOB PRIMARY KEY, text TEXT NOT NULL, confidence REAL NOT NULL)"
+        )
+        self._connection.commit()
+        logger.debug(f"Opened OCR cache at {cache_path}")
+
+    @staticmethod
+    def hash_file(image_path: Path) -> bytes:
+        """Compute the content hash of an image file."""
+        with image_path.open('rb') as f:
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+
+    def get(self, key: bytes) -> Optional[Tuple[str, float]]:
+        """Look up a cached OCR result.
+
+        Args:
+            key: Content hash of the image
+
+        Returns:
+            Tuple of (text, confidence) or None on a cache miss
+        """
+        row = self._connection.execute(
+            "SELECT text, confidence FROM ocr_cache WHERE hash = ?", (key,)
+        ).fetchone()
+        return (row[0], row[1]) if row is not None else None
+
+    def put(self, key: bytes, text: str, confidence: float) -> None:
+        """Store an OCR result.
+
+        Args:
+            key: Content hash of the image
+            text: Extracted text
+            confidence: OCR confidence score
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO ocr_cache (hash, text, confidence) VALUES (?, ?, ?)",
+            (key, text, confidence),
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._connection.close()
@@ -1,183 +1,352 @@
-"""Main orchestration logic for processing images and extracting transactions."""
-
-from pathlib import Path
-from typing import List, Optional
-
-import pandas as pd
-import sentry_sdk
-from loguru import logger
-
-from snap_transact.models import AppConfig, ProcessingResult, Transaction
-from snap_transact.ocr import OCRProcessor
-from snap_transact.parser import TransactionParser
-from snap_transact.utils import load_config, get_image_files
-
-
-def initialize_sentry(dsn: Optional[str]) -> None:
-    """Initialize Sentry for error tracking."""
-    if dsn:
-        sentry_sdk.init(
-            dsn=dsn,
-            traces_sample_rate=0.1,
-            profiles_sample_rate=0.1,
-        )
-        logger.info("Sentry initialized for error tracking")
-
-
-def process_single_image(
-    image_path: Path,
-    ocr_processor: OCRProcessor,
-    parser: TransactionParser,
-) -> List[Transaction]:
-    """Process a single image and extract transactions.
-    
-    Args:
-        image_path: Path to the image file
-        ocr_processor: OCR processor instance
-        parser: Transaction parser instance
-        
-    Returns:
-        List of extracted transactions
-    """
-    logger.info(f"Processing image: {image_path.name}")
-    
-    try:
-        # Validate image
-        if not ocr_processor.validate_image(image_path):
-            logger.warning(f"Skipping invalid image: {image_path}")
-            return []
-        
-        # Extract text from image
-        text, confidence = ocr_processor.extract_text_from_image(image_path)
-        
-        if not text or len(text.strip()) < 5:
-            logger.warning(f"No meaningful text extracted from {image_path}")
-            return []
-        
-        logger.debug(f"Extracted text ({len(text)} chars, confidence: {confidence:.2f})")
-        
-        # Parse transactions from text
-        transactions = parser.parse_transaction_from_text(
-            text=text,
-            source_file=str(image_path),
-            confidence=confidence
-        )
-        
-        logger.info(f"Extracted {len(transactions)} transactions from {image_path.name}")
-        return transactions
-        
-    except Exception as e:
-        logger.error(f"Failed to process image {image_path}: {e}")
-        if sentry_sdk.Hub.current.client:
-            sentry_sdk.capture_exception(e)
-        return []
-
-
-def export_transactions_to_csv(transactions: List[Transaction], output_path: Path) -> None:
-    """Export transactions to CSV file.
-    
-    Args:
-        transactions: List of transactions to export
-        output_path: Output CSV file path
-    """
-    if not transactions:
-        logger.warning("No transactions to export")
-        return
-    
-    # Convert transactions to DataFrame
-    data = []
-    for transaction in transactions:
-        data.append({
-            'date': transaction.date.strftime('%Y-%m-%d') if transaction.date else '',
-            'amount': str(transaction.amount) if transaction.amount else '',
-            'description': transaction.description or '',
-            'account': transaction.account or '',
-            'category': transaction.category or '',
-            'reference': transaction.reference or '',
-            'balance': str(transaction.balance) if transaction.balance else '',
-            'source_file': transaction.source_file or '',
-            'confidence': f"{transaction.confidence:.2f}" if transaction.confidence else '',
-        })
-    
-    df = pd.DataFrame(data)
-    
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Export to CSV
-    df.to_csv(output_path, index=False, encoding='utf-8')
-    logger.info(f"Exported {len(transactions)} transactions to {output_path}")
-
-
-def process_images(
-    input_path: Path,
-    output_path: Path,
-    config_path: Optional[Path] = None,
-) -> ProcessingResult:
-    """Main function to process images and extract transaction data.
-    
-    Args:
-        input_path: Path to image file or directory
-        output_path: Output CSV file path
-        config_path: Optional configuration file path
-        
-    Returns:
-        ProcessingResult with processing statistics
-    """
-    logger.info("Starting transaction extraction process")
-    
-    # Load configuration
-    config = load_config(config_path)
-    
-    # Initialize Sentry
-    initialize_sentry(config.sentry_dsn)
-    
-    # Initialize processors
-    ocr_processor = OCRProcessor(config.ocr)
-    parser = TransactionParser()
-    
-    # Get list of image files to process
-    image_files = get_image_files(input_path, config.supported_formats)
-    
-    if not image_files:
-        logger.warning(f"No supported image files found in {input_path}")
-        return ProcessingResult(processed_count=0, transaction_count=0)
-    
-    logger.info(f"Found {len(image_files)} image files to process")
-    
-    # Process all images
-    all_transactions: List[Transaction] = []
-    processed_count = 0
-    failed_count = 0
-    
-    for image_path in image_files:
-        try:
-            transactions = process_single_image(image_path, ocr_processor, parser)
-            all_transactions.extend(transactions)
-            processed_count += 1
-            logger.debug(f"Progress: {processed_count}/{len(image_files)} images processed")
-        except Exception as e:
-            logger.error(f"Failed to process {image_path}: {e}")
-            failed_count += 1
-            if sentry_sdk.Hub.current.client:
-                sentry_sdk.capture_exception(e)
-    
-    # Export results
-    if all_transactions:
-        export_transactions_to_csv(all_transactions, output_path)
-    else:
-        logger.warning("No transactions extracted from any images")
-    
-    # Return processing result
-    result = ProcessingResult(
-        processed_count=processed_count,
-        transaction_count=len(all_transactions),
-        failed_count=failed_count,
-        transactions=all_transactions,
-    )
-    
-    logger.info(f"Processing complete: {result.processed_count} images processed, "
-                f"{result.transaction_count} transactions extracted, "
-                f"{result.failed_count} failures")
-    
+"""Main orchestration logic for processing images and extracting transactions."""
+
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import sentry_sdk
+from loguru import logger
+
+from snap_transact.cache import OCRCache
+from snap_transact.models import AppConfig, OCRSettings, ProcessingResult, Transaction
+from snap_transact.ocr import OCRProcessor
+from snap_transact.parser import TransactionParser
+from snap_transact.pipeline import run_ocr_pipeline
+from snap_transact.utils import load_config, get_image_files
+
+
+# Set by initialize_sentry; a module flag on the error paths avoids the
+# contextvar walk behind sentry_sdk.Hub.current on every exception
+_SENTRY_ENABLED = False
+
+
+def initialize_sentry(dsn: Optional[str]) -> None:
+    """Initialize Sentry for error tracking."""
+    global _SENTRY_ENABLED
+    if dsn:
+        sentry_sdk.init(
+            dsn=dsn,
+            traces_sample_rate=0.1,
+            profiles_sample_rate=0.1,
+        )
+        _SENTRY_ENABLED = True
+        logger.info("Sentry initialized for error tracking")
+
+
+def process_single_image(
+    image_path: Path,
+    ocr_processor: OCRProcessor,
+    parser: TransactionParser,
+    cache: Optional[OCRCache] = None,
+) -> List[Transaction]:
+    """Process a single image and extract transactions.
+
+    Args:
+        image_path: Path to the image file
+        ocr_processor: OCR processor instance
+        parser: Transaction parser instance
+        cache: Optional OCR result cache to skip reprocessing unchanged images
+
+    Returns:
+        List of extracted transactions
+    """
+    logger.info(f"Processing image: {image_path.name}")
+
+    try:
+        # Extract text from image, going through the cache when enabled;
+        # validation happens inside extract_text_from_image so the file is
+        # opened exactly once
+        cached = None
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.hash_file(image_path)
+            cached = cache.get(cache_key)
+
+        if cached is not None:
+            logger.debug(f"OCR cache hit for {image_path.name}")
+            text, confidence = cached
+        else:
+            text, confidence = ocr_processor.extract_text_from_image(image_path)
+            if cache is not None and cache_key is not None and text:
+                cache.put(cache_key, text, confidence)
+
+        if not text or len(text.strip()) < 5:
+            logger.warning(f"No meaningful text extracted from {image_path}")
+            return []
+        
+        logger.debug(f"Extracted text ({len(text)} chars, confidence: {confidence:.2f})")
+        
+        # Parse transactions from text
+        transactions = parser.parse_transaction_from_text(
+            text=text,
+            source_file=str(image_path),
+            confidence=confidence
+        )
+        
+        logger.info(f"Extracted {len(transactions)} transactions from {image_path.name}")
+        return transactions
+        
+    except ValueError as e:
+        logger.warning(f"Skipping invalid image {image_path}: {e}")
+        return []
+    except Exception as e:
+        logger.error(f"Failed to process image {image_path}: {e}")
+        if _SENTRY_ENABLED:
+            sentry_sdk.capture_exception(e)
+        return []
+
+
+# Per-worker-process OCR processor and cache, kept alive across tasks so the
+# in-process Tesseract backend loads its language models only once and the
+# cache connection is not reopened per image
+_worker_ocr_processor: Optional[OCRProcessor] = None
+_worker_cache: Optional[OCRCache] = None
+_worker_cache_path: Optional[Path] = None
+
+
+def _process_image_worker(
+    image_path: Path,
+    ocr_settings: OCRSettings,
+    cache_path: Optional[Path] = None,
+) -> List[Transaction]:
+    """Process a single image inside a worker process.
+
+    The OCRProcessor and OCRCache cannot be pickled across process
+    boundaries, so each worker builds its own on first use and reuses them
+    for subsequent tasks.
+
+    Args:
+        image_path: Path to the image file
+        ocr_settings: OCR configuration settings
+        cache_path: Optional path to the OCR result cache database
+
+    Returns:
+        List of extracted transactions
+    """
+    global _worker_ocr_processor, _worker_cache, _worker_cache_path
+    if _worker_ocr_processor is None or _worker_ocr_processor.settings != ocr_settings:
+        _worker_ocr_processor = OCRProcessor(ocr_settings)
+    if cache_path != _worker_cache_path:
+        _worker_cache = OCRCache(cache_path) if cache_path else None
+        _worker_cache_path = cache_path
+    parser = TransactionParser()
+    return process_single_image(image_path, _worker_ocr_processor, parser, _worker_cache)
+
+
+# 1 MiB write buffer; the default 8 KiB forces a syscall every few hundred
+# rows on large exports
+_CSV_BUFFER_SIZE = 1024 * 1024
+
+_CSV_HEADERS: Tuple[str, ...] = (
+    'date', 'amount', 'description', 'account', 'category',
+    'reference', 'balance', 'source_file', 'confidence',
+)
+
+
+def _transaction_row(transaction: Transaction) -> Tuple[str, ...]:
+    """Format a transaction as a CSV row matching _CSV_HEADERS."""
+    return (
+        transaction.date.strftime('%Y-%m-%d') if transaction.date else '',
+        str(transaction.amount) if transaction.amount else '',
+        transaction.description or '',
+        transaction.account or '',
+        transaction.category or '',
+        transaction.reference or '',
+        str(transaction.balance) if transaction.balance else '',
+        transaction.source_file or '',
+        f"{transaction.confidence:.2f}" if transaction.confidence else '',
+    )
+
+
+def export_transactions_to_csv(transactions: List[Transaction], output_path: Path) -> None:
+    """Export transactions to CSV file.
+
+    Rows are streamed with the stdlib csv writer, so the export allocates
+    no intermediate table regardless of batch size.
+
+    Args:
+        transactions: List of transactions to export
+        output_path: Output CSV file path
+    """
+    if not transactions:
+        logger.warning("No transactions to export")
+        return
+
+    # Ensure output directory exists
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Export to CSV
+    with output_path.open('w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(_CSV_HEADERS)
+        writer.writerows(_transaction_row(transaction) for transaction in transactions)
+
+    logger.info(f"Exported {len(transactions)} transactions to {output_path}")
+
+
+def process_images(
+    input_path: Path,
+    output_path: Path,
+    config_path: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> ProcessingResult:
+    """Main function to process images and extract transaction data.
+
+    Args:
+        input_path: Path to image file or directory
+        output_path: Output CSV file path
+        config_path: Optional configuration file path
+        workers: Number of worker processes (defaults to CPU count)
+
+    Returns:
+        ProcessingResult with processing statistics
+    """
+    logger.info("Starting transaction extraction process")
+    
+    # Load configuration
+    config = load_config(config_path)
+    
+    # Initialize Sentry
+    initialize_sentry(config.sentry_dsn)
+    
+    # Initialize processors
+    ocr_processor = OCRProcessor(config.ocr)
+    parser = TransactionParser()
+    
+    # Get list of image files to process
+    image_files = get_image_files(
+        input_path, config.supported_formats, config.sort_by_inode, config.warm_page_cache
+    )
+    
+    if not image_files:
+        logger.warning(f"No supported image files found in {input_path}")
+        return ProcessingResult(processed_count=0, transaction_count=0)
+    
+    logger.info(f"Found {len(image_files)} image files to process")
+
+    # Process all images, streaming extracted transactions to the output CSV
+    # as they arrive so memory stays flat regardless of batch size
+    processed_count = 0
+    failed_count = 0
+    transaction_count = 0
+    csv_file = None
+    csv_writer = None
+
+    def _write_transactions(transactions: List[Transaction]) -> None:
+        """Append transactions to the output CSV, opening it on first use."""
+        nonlocal csv_file, csv_writer, transaction_count
+        if not transactions:
+            return
+        if csv_writer is None:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            csv_file = output_path.open('w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE)
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(_CSV_HEADERS)
+        csv_writer.writerows(_transaction_row(transaction) for transaction in transactions)
+        transaction_count += len(transactions)
+
+    max_workers = workers if workers is not None else (os.cpu_count() or 1)
+    cache = OCRCache(config.cache_path) if config.cache_path else None
+
+    try:
+        if max_workers > 1 and len(image_files) > 1:
+            # Dispatch images to worker processes; tesseract dominates CPU time,
+            # so throughput scales with core count on multi-image batches.
+            logger.info(f"Processing images with {max_workers} worker processes")
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _process_image_worker, image_path, config.ocr, config.cache_path
+                    ): image_path
+                    for image_path in image_files
+                }
+                for future in as_completed(futures):
+                    image_path = futures[future]
+                    try:
+                        _write_transactions(future.result())
+                        processed_count += 1
+                        logger.debug(f"Progress: {processed_count}/{len(image_files)} images processed")
+                    except Exception as e:
+                        logger.error(f"Failed to process {image_path}: {e}")
+                        failed_count += 1
+                        if _SENTRY_ENABLED:
+                            sentry_sdk.capture_exception(e)
+        elif len(image_files) > 1:
+            # Single-worker batch: overlap image loading and preprocessing with
+            # OCR via the threaded pipeline instead of running stages in lockstep.
+            logger.info("Processing images with threaded OCR pipeline")
+            ocr_results = []
+            pending = image_files
+            cache_keys = {}
+            if cache is not None:
+                pending = []
+                for image_path in image_files:
+                    cache_keys[image_path] = cache.hash_file(image_path)
+                    hit = cache.get(cache_keys[image_path])
+                    if hit is not None:
+                        logger.debug(f"OCR cache hit for {image_path.name}")
+                        ocr_results.append((image_path, hit[0], hit[1], None))
+                    else:
+                        pending.append(image_path)
+
+            fresh_results = run_ocr_pipeline(pending, ocr_processor) if pending else []
+            if cache is not None:
+                for image_path, text, confidence, error in fresh_results:
+                    if text:
+                        cache.put(cache_keys[image_path], text, confidence)
+
+            for image_path, text, confidence, error in ocr_results + fresh_results:
+                if error is not None:
+                    logger.error(f"Failed to process {image_path}: {error}")
+                    failed_count += 1
+                    if _SENTRY_ENABLED:
+                        sentry_sdk.capture_exception(error)
+                    continue
+                processed_count += 1
+                if not text or len(text.strip()) < 5:
+                    logger.warning(f"No meaningful text extracted from {image_path}")
+                    continue
+                transactions = parser.parse_transaction_from_text(
+                    text=text,
+                    source_file=str(image_path),
+                    confidence=confidence,
+                )
+                _write_transactions(transactions)
+                logger.debug(f"Progress: {processed_count}/{len(image_files)} images processed")
+        else:
+            for image_path in image_files:
+                try:
+                    transactions = process_single_image(image_path, ocr_processor, parser, cache)
+                    _write_transactions(transactions)
+                    processed_count += 1
+                    logger.debug(f"Progress: {processed_count}/{len(image_files)} images processed")
+                except Exception as e:
+                    logger.error(f"Failed to process {image_path}: {e}")
+                    failed_count += 1
+                    if _SENTRY_ENABLED:
+                        sentry_sdk.capture_exception(e)
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+        if cache is not None:
+            cache.close()
+
+    if transaction_count:
+        logger.info(f"Exported {transaction_count} transactions to {output_path}")
+    else:
+        logger.warning("No transactions extracted from any images")
+
+    # Return processing result
+    result = ProcessingResult(
+        processed_count=processed_count,
+        transaction_count=transaction_count,
+        failed_count=failed_count,
+    )
+
+    logger.info(f"Processing complete: {result.processed_count} images processed, "
+                f"{result.transaction_count} transactions extracted, "
+                f"{result.failed_count} failures")
+
     return result 
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Main CLI entrypoint for SnapTransact."""
 
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -44,7 +45,7 @@ def main(
         logger.configure(
             handlers=[
                 {
-                    "sink": "sys.stderr",
+                    "sink": sys.stderr,
                     "level": "DEBUG",
                     "format": "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
                 }
@@ -54,7 +55,7 @@ def main(
         logger.configure(
             handlers=[
                 {
-                    "sink": "sys.stderr",
+                    "sink": sys.stderr,
                     "level": "INFO",
                     "format": "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
                 }
@@ -82,13 +83,20 @@ def process(
         help="Path to configuration file",
         exists=True,
     ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of worker processes (defaults to CPU count)",
+    ),
 ) -> None:
     """Process images and extract transaction data to CSV."""
     logger.info(f"Processing images from: {input_path}")
     logger.info(f"Output will be saved to: {output}")
-    
+
     try:
-        result = process_images(input_path, output, config)
+        result = process_images(input_path, output, config, workers)
         logger.success(f"Successfully processed {result.processed_count} images")
         logger.success(f"Extracted {result.transaction_count} transactions")
         logger.success(f"Results saved to: {output}")
@@ -1,27 +1,33 @@
-"""Pydantic models for transaction data and configuration."""
+"""Models for transaction data and configuration."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
-class Transaction(BaseModel):
-    """Transaction data model."""
+@dataclass(slots=True)
+class Transaction:
+    """Transaction data model.
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    A plain dataclass rather than a pydantic model: instances are built in
+    the per-image hot loop from values the parser has already validated, so
+    pydantic field validation would be repeated work. slots avoids the
+    per-instance dict.
+    """
 
-    date: Optional[datetime] = Field(None, description="Transaction date")
-    amount: Optional[Decimal] = Field(None, description="Transaction amount")
-    description: Optional[str] = Field(None, description="Transaction description")
-    account: Optional[str] = Field(None, description="Account information")
-    category: Optional[str] = Field(None, description="Transaction category")
-    reference: Optional[str] = Field(None, description="Reference number")
-    balance: Optional[Decimal] = Field(None, description="Account balance after transaction")
-    source_file: Optional[str] = Field(None, description="Source image file path")
-    confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="OCR confidence score")
+    date: Optional[datetime] = None
+    amount: Optional[Decimal] = None
+    description: Optional[str] = None
+    account: Optional[str] = None
+    category: Optional[str] = None
+    reference: Optional[str] = None
+    balance: Optional[Decimal] = None
+    source_file: Optional[str] = None
+    confidence: Optional[float] = None
 
 
 class ProcessingResult(BaseModel):
@@ -38,9 +44,13 @@ class OCRSettings(BaseModel):
 
     language: str = Field(default="eng+vie", description="Tesseract language codes")
     oem: int = Field(default=3, description="OCR Engine Mode")
-    psm: int = Field(default=6, description="Page Segmentation Mode")
+    psm: int = Field(default=4, description="Page Segmentation Mode (4 = single column, suits receipts)")
     dpi: int = Field(default=300, description="DPI for image processing")
     preprocess: bool = Field(default=True, description="Enable image preprocessing")
+    binarize: bool = Field(
+        default=False,
+        description="Adaptively threshold to black/white after preprocessing; high-contrast input lets tesseract do less work"
+    )
 
 
 class AppConfig(BaseModel):
@@ -55,5 +65,21 @@ class AppConfig(BaseModel):
         description="Supported image formats"
     )
     max_image_size: int = Field(default=10_000_000, description="Maximum image size in bytes")
+    sort_by_inode: bool = Field(
+        default=False,
+        description="Process images in inode order for better read locality on rotational storage"
+    )
+    warm_page_cache: bool = Field(
+        default=False,
+        description="Prefetch discovered images into the OS page cache in background threads to hide read latency on slow or network storage"
+    )
+
+    cache_path: Optional[Path] = Field(None, description="Path to the OCR result cache database (caching disabled when unset)")
     sentry_dsn: Optional[str] = Field(None, description="Sentry DSN for error tracking")
-    log_level: str = Field(default="INFO", description="Logging level") 
\ No newline at end of file
+    log_level: str = Field(default="INFO", description="Logging level")
+
+    @field_validator('supported_formats')
+    @classmethod
+    def _lowercase_formats(cls, value: List[str]) -> List[str]:
+        """Normalize extensions once at construction instead of per lookup."""
+        return [fmt.lower() for fmt in value] 
\ No newline at end of file
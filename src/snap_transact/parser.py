@@ -3,162 +3,252 @@
 import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional, Pattern
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
 
 from loguru import logger
 
 from snap_transact.models import Transaction
 
+# All patterns are compiled once at import time; parser instances are created
+# per worker process, so per-instance compilation would repeat this work.
+# Each extraction category is a single alternation with named groups, so one
+# scan over the OCR text covers every supported format; dispatch happens on
+# the group name of the matched alternative.
+
+# Date formats: ISO, DD/MM/YYYY, DD.MM.YYYY, DD/MM/YY, Vietnamese long form
+_DATE_RE = re.compile(
+    r'(?P<iso>(\d{4})-(\d{1,2})-(\d{1,2}))'
+    r'|(?P<dmy>(\d{1,2})[/-](\d{1,2})[/-](\d{4}))'
+    r'|(?P<dmy_dot>(\d{1,2})\.(\d{1,2})\.(\d{4}))'
+    r'|(?P<dmy_short>(\d{1,2})[/-](\d{1,2})[/-](\d{2}))'
+    r'|(?P<viet>ngày\s+(\d{1,2})\s+tháng\s+(\d{1,2})\s+năm\s+(\d{4}))',
+    re.IGNORECASE,
+)
+
+# Datetime constructor per date alternative, taking the numeric subgroups in
+# match order; dispatching on the group name means no re-inspection of the
+# matched text to work out which format it was
+_DATE_CTORS: Dict[str, Callable[[List[int]], datetime]] = {
+    'iso': lambda n: datetime(n[0], n[1], n[2]),
+    'dmy': lambda n: datetime(n[2], n[1], n[0]),
+    'dmy_dot': lambda n: datetime(n[2], n[1], n[0]),
+    'dmy_short': lambda n: datetime(2000 + n[2] if n[2] < 50 else 1900 + n[2], n[1], n[0]),
+    'viet': lambda n: datetime(n[2], n[1], n[0]),
+}
+
+# Amount formats: Vietnamese currency, currency symbol, currency code, bare number
+_AMOUNT_RE = re.compile(
+    r'(?P<vnd>[\d.,]+)\s*(?:VND|VNĐ|đ)'
+    r'|[\$€£¥]\s*(?P<symbol>[\d.,]+)'
+    r'|(?P<word>[\d.,]+)\s*(?:USD|EUR|GBP|JPY)'
+    r'|[+-]?(?P<bare>[\d.,]+)',
+    re.IGNORECASE,
+)
+
+# Labelled currency formats take precedence over bare numbers regardless of
+# where they appear in the text
+_AMOUNT_PRIORITY: Dict[str, int] = {'vnd': 0, 'symbol': 1, 'word': 2, 'bare': 3}
+
+# Anglo-style amounts: comma thousand separators, dot decimal separator
+_ANGLO_AMOUNT_RE = re.compile(r'(?:\d{1,3}(?:,\d{3})*|\d+)(?:\.\d{1,2})?$')
+
+# Translation tables for separator stripping; one C-level translate call
+# replaces chained str.replace passes
+_STRIP_SEPARATORS = str.maketrans('', '', '.,')
+_STRIP_DOTS = str.maketrans('', '', '.')
+_STRIP_COMMAS = str.maketrans('', '', ',')
+
+# Reference formats: labelled references, ATM codes, FT (Fund Transfer) codes.
+# The captured token must contain at least one digit so that prose following
+# a keyword (e.g. "transaction info") is not mistaken for a reference.
+_REFERENCE_RE = re.compile(
+    r'(?:reference|transaction|trans|ref|mã gd|id)[\s:]*(?P<kw>[A-Z0-9]*\d[A-Z0-9]*)'
+    r'|ATM[\s:]*(?P<atm>[A-Z0-9]*\d[A-Z0-9]*)'
+    r'|FT[\s:]*(?P<ft>[A-Z0-9]*\d[A-Z0-9]*)',
+    re.IGNORECASE,
+)
+
+# Common Vietnamese transaction description patterns
+_DESCRIPTION_PATTERNS: Tuple[Pattern[str], ...] = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:mo ta|mô tả|noi dung|nội dung)[\s:]*([^\n]+)',
+        r'(?:description|desc)[\s:]*([^\n]+)',
+        r'(?:remark|note)[\s:]*([^\n]+)',
+    )
+)
+
+# Single alternation used to skip non-description lines in the fallback
+# path; one scan per line classifies it as date-like, amount-like, or
+# reference-like instead of three separate searches
+_SKIP_LINE_RE = re.compile(
+    r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'
+    r'|[\d.,]+\s*(?:VND|VNĐ|đ|\$)'
+    r'|^[A-Z0-9]{6,}$'
+)
+
+
+def _clean_amount(kind: str, raw: str) -> Optional[str]:
+    """Normalize a raw amount string for the matched currency format.
+
+    Args:
+        kind: Name of the matched amount alternative
+        raw: Raw captured amount string
+
+    Returns:
+        Normalized amount string, or None if the format is invalid
+    """
+    if kind == 'vnd':
+        # Vietnamese format: dots and commas are thousand separators
+        return raw.translate(_STRIP_SEPARATORS)
+
+    if kind in ('symbol', 'word'):
+        # Anglo format: commas are thousand separators, dot is decimal
+        if not _ANGLO_AMOUNT_RE.fullmatch(raw):
+            return None
+        return raw.translate(_STRIP_COMMAS)
+
+    # Bare number: guess the separator convention from counts taken once
+    if raw.count('.') > 1:
+        # Multiple dots are thousand separators
+        return raw.translate(_STRIP_DOTS)
+    if ',' in raw:
+        parts = raw.split(',')
+        if len(parts) == 2 and len(parts[1]) <= 2:
+            # Likely decimal separator
+            return parts[0].translate(_STRIP_DOTS) + '.' + parts[1]
+        # Likely thousand separator
+        return raw.translate(_STRIP_COMMAS)
+    return raw.translate(_STRIP_SEPARATORS)
+
+
+def _parse_vietnamese_date(text: str) -> Optional[datetime]:
+    """Parse the 'ngày D tháng M năm YYYY' long form with literal scans.
+
+    str.find on the fixed tokens runs as a C substring scan, which beats
+    entering the regex engine for this fully literal format. Returns None
+    on any structural surprise so the caller can fall back to the regex.
+
+    Args:
+        text: Input text known to contain 'tháng'
+
+    Returns:
+        Parsed datetime object or None if the long form is not present
+    """
+    thang = text.find('tháng')
+    nam = text.find('năm', thang + 5)
+    if nam == -1:
+        return None
+    try:
+        day = int(text[:thang].split()[-1])
+        month = int(text[thang + 5:nam])
+        year_token = text[nam + 3:].lstrip()[:4]
+        if not year_token.isdigit():
+            return None
+        return datetime(int(year_token), month, day)
+    except (IndexError, ValueError):
+        return None
+
 
 class TransactionParser:
     """Parses OCR text to extract transaction information."""
 
-    def __init__(self) -> None:
-        """Initialize parser with regex patterns."""
-        self.date_patterns = self._compile_date_patterns()
-        self.amount_patterns = self._compile_amount_patterns()
-        self.reference_patterns = self._compile_reference_patterns()
-
-    def _compile_date_patterns(self) -> List[Pattern[str]]:
-        """Compile regex patterns for date extraction."""
-        patterns = [
-            # DD/MM/YYYY or DD-MM-YYYY
-            re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', re.IGNORECASE),
-            # DD/MM/YY or DD-MM-YY
-            re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2})', re.IGNORECASE),
-            # YYYY-MM-DD
-            re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})', re.IGNORECASE),
-            # DD.MM.YYYY
-            re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', re.IGNORECASE),
-            # Vietnamese date format: ngày DD tháng MM năm YYYY
-            re.compile(r'ngày\s+(\d{1,2})\s+tháng\s+(\d{1,2})\s+năm\s+(\d{4})', re.IGNORECASE),
-        ]
-        logger.debug(f"Compiled {len(patterns)} date patterns")
-        return patterns
-
-    def _compile_amount_patterns(self) -> List[Pattern[str]]:
-        """Compile regex patterns for amount extraction."""
-        patterns = [
-            # Vietnamese currency: 1.000.000 VND or 1,000,000 VND
-            re.compile(r'([\d.,]+)\s*(?:VND|VNĐ|đ)', re.IGNORECASE),
-            # Amount with currency symbol: $1,000.00
-            re.compile(r'[\$€£¥]\s*([\d.,]+)', re.IGNORECASE),
-            # Amount followed by currency: 1000.00 USD
-            re.compile(r'([\d.,]+)\s*(?:USD|EUR|GBP|JPY)', re.IGNORECASE),
-            # Vietnamese format: -1.000.000 or +1.000.000
-            re.compile(r'[+-]?\s*([\d.,]+)', re.IGNORECASE),
-        ]
-        logger.debug(f"Compiled {len(patterns)} amount patterns")
-        return patterns
-
-    def _compile_reference_patterns(self) -> List[Pattern[str]]:
-        """Compile regex patterns for reference number extraction."""
-        patterns = [
-            # Transaction ID, Reference, etc.
-            re.compile(r'(?:ref|reference|trans|transaction|id|mã gd)[\s:]*([A-Z0-9]+)', re.IGNORECASE),
-            # ATM transaction codes
-            re.compile(r'ATM[\s:]*([A-Z0-9]+)', re.IGNORECASE),
-            # FT (Fund Transfer) codes
-            re.compile(r'FT[\s:]*([A-Z0-9]+)', re.IGNORECASE),
-        ]
-        logger.debug(f"Compiled {len(patterns)} reference patterns")
-        return patterns
-
     def parse_date(self, text: str) -> Optional[datetime]:
         """Extract date from text.
-        
+
         Args:
             text: Input text to parse
-            
+
         Returns:
             Parsed datetime object or None if not found
         """
-        for pattern in self.date_patterns:
-            match = pattern.search(text)
-            if match:
-                try:
-                    groups = match.groups()
-                    if len(groups) == 3:
-                        # Handle different date formats
-                        if len(groups[0]) == 4:  # YYYY-MM-DD format
-                            year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                        elif "tháng" in match.group(0).lower():  # Vietnamese format
-                            day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-                        else:  # DD/MM/YYYY or DD-MM-YY format
-                            day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-                            if year < 100:  # Handle 2-digit years
-                                year += 2000 if year < 50 else 1900
-                        
-                        date_obj = datetime(year, month, day)
-                        logger.debug(f"Parsed date: {date_obj.strftime('%Y-%m-%d')}")
-                        return date_obj
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"Failed to parse date from {match.group(0)}: {e}")
-                    continue
-        
+        # Fast path for the Vietnamese long form: its tokens are fixed
+        # literals, so a substring check plus slicing skips the regex
+        # engine entirely on the texts where it applies
+        if 'tháng' in text:
+            date_obj = _parse_vietnamese_date(text)
+            if date_obj is not None:
+                logger.debug(f"Parsed date: {date_obj.strftime('%Y-%m-%d')}")
+                return date_obj
+
+        for match in _DATE_RE.finditer(text):
+            kind = match.lastgroup or next(
+                name for name, value in match.groupdict().items() if value is not None
+            )
+            numbers = [int(group) for group in match.groups() if group and group.isdigit()]
+            try:
+                date_obj = _DATE_CTORS[kind](numbers)
+                logger.debug(f"Parsed date: {date_obj.strftime('%Y-%m-%d')}")
+                return date_obj
+            except (IndexError, KeyError, ValueError) as e:
+                logger.debug(f"Failed to parse date from {match.group(0)}: {e}")
+                continue
+
         logger.debug("No date found in text")
         return None
 
     def parse_amount(self, text: str) -> Optional[Decimal]:
         """Extract amount from text.
-        
+
         Args:
             text: Input text to parse
-            
+
         Returns:
             Parsed Decimal amount or None if not found
         """
-        for pattern in self.amount_patterns:
-            matches = pattern.findall(text)
-            for match in matches:
-                try:
-                    # Clean the amount string
-                    amount_str = str(match).replace(',', '').replace('.', '')
-                    
-                    # Handle Vietnamese format (dots as thousand separators)
-                    if '.' in str(match) and str(match).count('.') > 1:
-                        # Remove thousand separators (dots)
-                        amount_str = str(match).replace('.', '', str(match).count('.') - 1)
-                        amount_str = amount_str.replace('.', '')
-                    elif ',' in str(match):
-                        # Handle comma as decimal separator or thousand separator
-                        parts = str(match).split(',')
-                        if len(parts) == 2 and len(parts[1]) <= 2:
-                            # Likely decimal separator
-                            amount_str = parts[0].replace('.', '') + '.' + parts[1]
-                        else:
-                            # Likely thousand separator
-                            amount_str = str(match).replace(',', '')
-                    
-                    amount = Decimal(amount_str)
-                    if amount > 0:  # Only return positive amounts
-                        logger.debug(f"Parsed amount: {amount}")
-                        return amount
-                        
-                except (InvalidOperation, ValueError) as e:
-                    logger.debug(f"Failed to parse amount from {match}: {e}")
-                    continue
-        
+        best: Optional[Tuple[int, Decimal]] = None
+
+        for match in _AMOUNT_RE.finditer(text):
+            kind = match.lastgroup or 'bare'
+            priority = _AMOUNT_PRIORITY[kind]
+            if best is not None and priority >= best[0]:
+                continue
+
+            raw = match.group(kind)
+            if kind == 'bare' and len(raw) < 3:
+                # Too short to be a plausible amount; mostly date and phone
+                # number fragments on real OCR text
+                continue
+
+            amount_str = _clean_amount(kind, raw)
+            if amount_str is None:
+                logger.debug(f"Skipping malformed amount: {raw}")
+                continue
+
+            try:
+                amount = Decimal(amount_str)
+            except (InvalidOperation, ValueError) as e:
+                logger.debug(f"Failed to parse amount from {raw}: {e}")
+                continue
+
+            if amount > 0:  # Only accept positive amounts
+                best = (priority, amount)
+                if priority == 0:  # Nothing can outrank a labelled VND amount
+                    break
+
+        if best is not None:
+            logger.debug(f"Parsed amount: {best[1]}")
+            return best[1]
+
         logger.debug("No valid amount found in text")
         return None
 
     def parse_reference(self, text: str) -> Optional[str]:
         """Extract reference number from text.
-        
+
         Args:
             text: Input text to parse
-            
+
         Returns:
             Reference number or None if not found
         """
-        for pattern in self.reference_patterns:
-            match = pattern.search(text)
-            if match:
-                reference = match.group(1).strip()
-                if len(reference) >= 4:  # Minimum length for valid reference
-                    logger.debug(f"Parsed reference: {reference}")
-                    return reference
-        
+        for match in _REFERENCE_RE.finditer(text):
+            kind = match.lastgroup
+            reference = match.group(kind).strip() if kind else ''
+            if len(reference) >= 4:  # Minimum length for valid reference
+                logger.debug(f"Parsed reference: {reference}")
+                return reference
+
         logger.debug("No reference found in text")
         return None
 
@@ -171,15 +261,7 @@ class TransactionParser:
         Returns:
             Transaction description or None if not found
         """
-        # Common Vietnamese transaction description patterns
-        desc_patterns = [
-            r'(?:mo ta|mô tả|noi dung|nội dung)[\s:]*([^\n]+)',
-            r'(?:description|desc)[\s:]*([^\n]+)',
-            r'(?:remark|note)[\s:]*([^\n]+)',
-        ]
-        
-        for pattern_str in desc_patterns:
-            pattern = re.compile(pattern_str, re.IGNORECASE)
+        for pattern in _DESCRIPTION_PATTERNS:
             match = pattern.search(text)
             if match:
                 description = match.group(1).strip()
@@ -191,12 +273,7 @@ class TransactionParser:
         lines = [line.strip() for line in text.split('\n') if line.strip()]
         for line in lines:
             # Skip lines that look like dates, amounts, or references
-            if not any([
-                re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', line),
-                re.search(r'[\d.,]+\s*(?:VND|VNĐ|đ|\$)', line),
-                re.search(r'^[A-Z0-9]{6,}$', line),
-                len(line) < 5,
-            ]):
+            if len(line) >= 5 and not _SKIP_LINE_RE.search(line):
                 logger.debug(f"Using line as description: {line[:50]}...")
                 return line
         
@@ -214,12 +291,14 @@ class TransactionParser:
         Returns:
             List of Transaction objects (may be empty if no transaction found)
         """
-        logger.debug(f"Parsing transaction from text (confidence: {confidence:.2f})")
-        
-        if not text or len(text.strip()) < 10:
+        # Gate before any other work: garbage or blank OCR output is common,
+        # and the raw length check costs nothing before paying for a strip
+        if not text or len(text) < 10 or len(text.strip()) < 10:
             logger.warning("Text too short to contain transaction data")
             return []
-        
+
+        logger.debug(f"Parsing transaction from text (confidence: {confidence:.2f})")
+
         # Extract transaction components
         date = self.parse_date(text)
         amount = self.parse_amount(text)
@@ -0,0 +1,131 @@
+"""Threaded OCR pipeline that overlaps image loading, preprocessing, and OCR."""
+
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from PIL import Image
+
+from snap_transact.ocr import (
+    MAX_IMAGE_BYTES,
+    MIN_IMAGE_DIMENSION,
+    SUPPORTED_FORMATS,
+    OCRProcessor,
+)
+
+# Bounded queue size between stages; provides backpressure so decoded
+# images do not pile up in memory faster than tesseract can consume them.
+QUEUE_SIZE = 4
+
+_SENTINEL = object()
+
+
+def run_ocr_pipeline(
+    image_files: List[Path],
+    ocr_processor: OCRProcessor,
+) -> List[Tuple[Path, str, float, Optional[Exception]]]:
+    """Run OCR over images with a three-stage producer/consumer pipeline.
+
+    Stage 1 loads and decodes images, stage 2 preprocesses them, stage 3
+    runs tesseract. Each stage runs in its own thread connected by bounded
+    queues, so disk I/O and PIL filtering overlap with the OCR subprocess
+    (both PIL and tesseract release the GIL for the heavy work).
+
+    Args:
+        image_files: Image files to process, in order
+        ocr_processor: OCR processor used for preprocessing and extraction
+
+    Returns:
+        List of (image_path, text, confidence, error) tuples in input
+        order. Images that fail to load, preprocess, or OCR yield
+        ("", 0.0) plus the exception so callers can count and report the
+        failure; successes carry None in the error slot.
+    """
+    preprocess_queue: "queue.Queue" = queue.Queue(maxsize=QUEUE_SIZE)
+    ocr_queue: "queue.Queue" = queue.Queue(maxsize=QUEUE_SIZE)
+    results: Dict[int, Tuple[Path, str, float, Optional[Exception]]] = {}
+
+    def load_stage() -> None:
+        for index, image_path in enumerate(image_files):
+            try:
+                file_size = image_path.stat().st_size
+                if file_size > MAX_IMAGE_BYTES:
+                    raise ValueError(f"file too large ({file_size} bytes)")
+
+                # Validation checks run on the already-open image so the
+                # file is decoded once, not twice
+                image = Image.open(image_path)
+                if not image.format or image.format.lower() not in SUPPORTED_FORMATS:
+                    raise ValueError(f"unsupported format {image.format}")
+                if image.size[0] < MIN_IMAGE_DIMENSION or image.size[1] < MIN_IMAGE_DIMENSION:
+                    raise ValueError(f"dimensions too small {image.size}")
+
+                # Scaled grayscale decode where the format supports it, then
+                # grayscale before resize so LANCZOS moves a third of the bytes
+                max_size = (2000, 2000)
+                image.draft('L', max_size)
+                image.load()
+                if image.mode != 'L':
+                    image = image.convert('L')
+
+                # Resize if image is still too large
+                if image.size[0] > max_size[0] or image.size[1] > max_size[1]:
+                    image.thumbnail(max_size, Image.Resampling.LANCZOS)
+                    logger.debug(f"Resized image to: {image.size}")
+            except Exception as e:
+                logger.error(f"Failed to load image {image_path}: {e}")
+                results[index] = (image_path, "", 0.0, e)
+                continue
+
+            preprocess_queue.put((index, image_path, image))
+
+        preprocess_queue.put(_SENTINEL)
+
+    def preprocess_stage() -> None:
+        while True:
+            item = preprocess_queue.get()
+            if item is _SENTINEL:
+                ocr_queue.put(_SENTINEL)
+                break
+
+            index, image_path, image = item
+            try:
+                image = ocr_processor.preprocess_image(image)
+            except Exception as e:
+                logger.error(f"Failed to preprocess image {image_path}: {e}")
+                results[index] = (image_path, "", 0.0, e)
+                continue
+
+            ocr_queue.put((index, image_path, image))
+
+    def ocr_stage() -> None:
+        while True:
+            item = ocr_queue.get()
+            if item is _SENTINEL:
+                break
+
+            index, image_path, image = item
+            error: Optional[Exception] = None
+            try:
+                text, confidence = ocr_processor.extract_text(image)
+            except Exception as e:
+                logger.error(f"OCR failed for image {image_path}: {e}")
+                text, confidence, error = "", 0.0, e
+
+            results[index] = (image_path, text, confidence, error)
+
+    threads = [
+        threading.Thread(target=load_stage, name="ocr-pipeline-load"),
+        threading.Thread(target=preprocess_stage, name="ocr-pipeline-preprocess"),
+        threading.Thread(target=ocr_stage, name="ocr-pipeline-ocr"),
+    ]
+
+    logger.debug(f"Starting OCR pipeline for {len(image_files)} images")
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return [results[index] for index in sorted(results)]
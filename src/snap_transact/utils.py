@@ -1,80 +1,299 @@
-"""Helper functions and utilities."""
-
-import os
-from pathlib import Path
-from typing import List, Optional
-
-import yaml
-from loguru import logger
-from pydantic import ValidationError
-
-from snap_transact.models import AppConfig
-
-
-def load_config(config_path: Optional[Path] = None) -> AppConfig:
-    """Load application configuration from file or environment variables.
-    
-    Args:
-        config_path: Optional path to YAML configuration file
-        
-    Returns:
-        AppConfig object with loaded configuration
-    """
-    config_data = {}
-    
-    # Load from YAML file if provided
-    if config_path and config_path.exists():
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f) or {}
-            logger.info(f"Loaded configuration from {config_path}")
-        except Exception as e:
-            logger.warning(f"Failed to load config file {config_path}: {e}")
-            logger.info("Using default configuration")
-    
-    # Create configuration object (will also load from environment variables)
-    try:
-        config = AppConfig(**config_data)
-        logger.debug("Configuration loaded successfully")
-        return config
-    except ValidationError as e:
-        logger.error(f"Configuration validation failed: {e}")
-        logger.info("Using default configuration")
-        return AppConfig()
-
-
-def get_image_files(input_path: Path, supported_formats: List[str]) -> List[Path]:
-    """Get list of supported image files from input path.
-    
-    Args:
-        input_path: Path to file or directory
-        supported_formats: List of supported file extensions
-        
-    Returns:
-        List of image file paths
-    """
-    image_files: List[Path] = []
-    
-    if input_path.is_file():
-        # Single file
-        if input_path.suffix.lower() in supported_formats:
-            image_files.append(input_path)
-            logger.debug(f"Single image file: {input_path}")
-        else:
-            logger.warning(f"Unsupported file format: {input_path.suffix}")
-    
-    elif input_path.is_dir():
-        # Directory of files
-        for file_path in input_path.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in supported_formats:
-                image_files.append(file_path)
-        
-        logger.debug(f"Found {len(image_files)} image files in directory: {input_path}")
-    
-    else:
-        logger.error(f"Input path does not exist or is not accessible: {input_path}")
-    
-    # Sort files for consistent processing order
-    image_files.sort()
-    
+"""Helper functions and utilities."""
+
+import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+from pydantic import ValidationError
+
+from snap_transact.models import AppConfig
+
+# Deployment config pre-compiled by snap_transact.configgen, if any;
+# importing a module literal costs nothing compared to a YAML parse
+try:
+    from snap_transact import _config_compiled
+except ImportError:
+    _config_compiled = None
+
+
+@lru_cache(maxsize=8)
+def _config_from_env(fingerprint: FrozenSet[Tuple[str, str]]) -> AppConfig:
+    """Build an AppConfig from the environment, memoized on its fingerprint.
+
+    The fingerprint is the frozenset of SNAP_TRANSACT_-prefixed variables,
+    so any override change produces a new key and a fresh build, while
+    repeated calls under an unchanged environment — including the common
+    no-overrides case — validate exactly once per process. Callers treat
+    configs as read-only, so sharing instances is safe.
+    """
+    return AppConfig()
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> AppConfig:
+    """Parse and validate a config file, memoized on path and stat identity.
+
+    Keying on mtime and size makes invalidation automatic: any edit to the
+    file produces a new key and falls through to a fresh parse.
+
+    Args:
+        path_str: Path to the YAML configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        AppConfig object with loaded configuration
+    """
+    config_data = {}
+    parsed = False
+
+    try:
+        if path_str.endswith('.json'):
+            with open(path_str, 'rb') as f:
+                config_data = json.load(f) or {}
+        else:
+            # Deferred import: every CLI run pays for this module, but only
+            # runs that actually read a YAML config need PyYAML. Prefer the
+            # libyaml-backed loader, which parses roughly 10x faster than
+            # the pure-Python SafeLoader.
+            import yaml
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            # Hand libyaml the raw bytes: UTF-8 decoding happens inside its
+            # C scanner instead of Python's text-io layer
+            with open(path_str, 'rb') as f:
+                config_data = yaml.load(f.read(), Loader=loader) or {}
+        parsed = True
+    except Exception as e:
+        logger.warning("Failed to load config file {}: {}", path_str, e)
+        logger.info("Using default configuration")
+
+    try:
+        config = AppConfig(**config_data)
+        # Announce the file only once its contents have both parsed and
+        # validated; a file that fell back to defaults was not loaded
+        if parsed:
+            logger.info("Loaded configuration from {}", path_str)
+        logger.debug("Configuration loaded successfully")
+        return config
+    except ValidationError as e:
+        logger.error("Configuration validation failed: {}", e)
+        logger.info("Using default configuration")
+        return AppConfig()
+
+
+def load_config(config_path: Optional[Path] = None) -> AppConfig:
+    """Load application configuration from file or environment variables.
+
+    Repeated loads of an unchanged file hit the parse cache and skip the
+    YAML and validation work entirely. The file-less path is not cached so
+    environment-variable overrides keep taking effect per call.
+
+    Args:
+        config_path: Optional path to YAML configuration file
+
+    Returns:
+        AppConfig object with loaded configuration
+    """
+    # Load from YAML file if provided; a single stat covers both the
+    # existence check and the cache key, and its mtime/size feed straight
+    # into the parse cache
+    if config_path:
+        try:
+            stat_result = os.stat(config_path)
+        except OSError:
+            stat_result = None
+        if stat_result is not None:
+            # Prefer a JSON sidecar (emitted by configgen convert) when it is
+            # at least as new as the YAML; json parses several times faster
+            # than even the libyaml loader
+            json_path = config_path.with_suffix('.json')
+            if json_path != config_path:
+                try:
+                    json_stat = os.stat(json_path)
+                except OSError:
+                    json_stat = None
+                if json_stat is not None and json_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                    return _load_config_cached(
+                        str(json_path), json_stat.st_mtime_ns, json_stat.st_size
+                    )
+            return _load_config_cached(
+                str(config_path), stat_result.st_mtime_ns, stat_result.st_size
+            )
+
+    # Fall back to a config compiled at deploy time, if one was generated
+    if _config_compiled is not None:
+        try:
+            config = AppConfig(**_config_compiled.CONFIG_DICT)
+            logger.debug("Configuration loaded from compiled module")
+            return config
+        except ValidationError as e:
+            logger.error("Compiled configuration validation failed: {}", e)
+            logger.info("Using default configuration")
+
+    # Create configuration object (will also load from environment
+    # variables); memoized on the relevant environment fingerprint so an
+    # unchanged environment validates once per process
+    fingerprint = frozenset(
+        item for item in os.environ.items() if item[0].startswith('SNAP_TRANSACT_')
+    )
+    try:
+        config = _config_from_env(fingerprint)
+        logger.debug("Configuration loaded successfully")
+        return config
+    except ValidationError as e:
+        logger.error("Configuration validation failed: {}", e)
+        logger.info("Using default configuration")
+        return AppConfig()
+
+
+# Allow tests and long-running embedders to drop memoized configs without
+# reaching into the private inner function
+load_config.cache_clear = _load_config_cached.cache_clear
+
+
+# Number of background threads used to warm the page cache after discovery
+_WARM_WORKERS = 8
+
+
+def _warm_file(path_str: str) -> None:
+    """Hint the kernel to prefetch one file's bytes into the page cache."""
+    try:
+        fd = os.open(path_str, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        # Warming is best-effort; the real read surfaces any error
+        pass
+
+
+def warm_page_cache(paths: Sequence[Path]) -> None:
+    """Prefetch file contents into the page cache in background threads.
+
+    Returns immediately; by the time OCR gets to each file its bytes are
+    typically already in RAM, which hides read latency on slow or network
+    storage. A no-op on platforms without posix_fadvise.
+
+    Args:
+        paths: Files to prefetch
+    """
+    if not paths or not hasattr(os, 'posix_fadvise'):
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(_WARM_WORKERS, len(paths)))
+    for path in paths:
+        executor.submit(_warm_file, str(path))
+    executor.shutdown(wait=False)
+
+
+@lru_cache(maxsize=8)
+def _normalize_formats(formats: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercase, dot-stripped extension set, built once per distinct list.
+
+    The same supported_formats list arrives on every discovery call, so
+    memoizing on the tuple form means the normalization runs once per
+    process rather than once per scan.
+    """
+    return frozenset(fmt.lstrip('.').lower() for fmt in formats)
+
+
+def iter_image_files(input_path: Path, supported_formats: List[str]) -> Iterator[Path]:
+    """Yield supported image files lazily, in directory order.
+
+    Paths are produced as os.scandir returns them, so callers can start
+    working on the first file while a large directory is still being
+    scanned, and no full file list is held in memory. No sorting is
+    applied; use get_image_files where deterministic order matters.
+
+    Args:
+        input_path: Path to file or directory
+        supported_formats: List of supported file extensions
+
+    Yields:
+        Paths of supported image files
+    """
+    # One stat call covers both the file and directory checks; Path.is_file
+    # plus Path.is_dir would stat the same inode twice
+    try:
+        mode = os.stat(input_path).st_mode
+    except OSError:
+        logger.error("Input path does not exist or is not accessible: {}", input_path)
+        return
+
+    if stat.S_ISREG(mode):
+        # Single file
+        if input_path.suffix.lower() in supported_formats:
+            logger.debug("Single image file: {}", input_path)
+            yield input_path
+        else:
+            logger.warning("Unsupported file format: {}", input_path.suffix)
+
+    elif stat.S_ISDIR(mode):
+        # Directory of files; os.scandir reuses the directory-entry data from
+        # the OS, and is_file(follow_symlinks=False) reads the cached d_type,
+        # so no per-file stat or Path construction happens until a name
+        # actually matches
+        allowed = _normalize_formats(tuple(supported_formats))
+        with os.scandir(input_path) as entries:
+            for entry in entries:
+                _, dot, extension = entry.name.rpartition('.')
+                # Extensions are normally lowercase already, so try the
+                # direct lookup first and only allocate a lowered copy on
+                # miss
+                if (
+                    dot
+                    and (extension in allowed or extension.lower() in allowed)
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    yield Path(entry.path)
+
+    else:
+        logger.error("Input path does not exist or is not accessible: {}", input_path)
+
+
+def get_image_files(
+    input_path: Path,
+    supported_formats: List[str],
+    sort_by_inode: bool = False,
+    warm_cache: bool = False,
+) -> List[Path]:
+    """Get list of supported image files from input path.
+
+    Thin wrapper over iter_image_files that materializes the results and
+    sorts them for consistent processing order. Name sorting uses the
+    plain name string (a C-level compare); sorting PurePath objects would
+    dispatch into Python per element. Inode sorting opens files in their
+    on-disk order, which turns the OCR read pattern near-sequential on
+    rotational media at the price of one extra stat per matched file.
+
+    Args:
+        input_path: Path to file or directory
+        supported_formats: List of supported file extensions
+        sort_by_inode: Sort by inode number instead of file name
+        warm_cache: Prefetch the matched files into the page cache; only
+            worth enabling when every discovered file is about to be read
+
+    Returns:
+        Sorted list of image file paths
+    """
+    if sort_by_inode:
+        sort_key = lambda path: path.stat().st_ino  # noqa: E731
+    else:
+        sort_key = lambda path: path.name  # noqa: E731
+
+    image_files = sorted(iter_image_files(input_path, supported_formats), key=sort_key)
+
+    if input_path.is_dir():
+        logger.debug("Found {} image files in directory: {}", len(image_files), input_path)
+
+    # Start pulling file bytes into the page cache while callers set up OCR
+    if warm_cache:
+        warm_page_cache(image_files)
+
     return image_files 
\ No newline at end of file
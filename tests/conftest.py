@@ -0,0 +1,18 @@
+"""Shared test fixtures."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def mock_logger(monkeypatch):
+    """Replace the utils module logger with a fresh mock for every test.
+
+    A direct attribute swap through monkeypatch is cheaper than a
+    mocker.patch per call site, and making it autouse keeps config and
+    discovery log output from leaking into test output everywhere.
+    """
+    mock = MagicMock()
+    monkeypatch.setattr("snap_transact.utils.logger", mock)
+    return mock
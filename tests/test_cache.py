@@ -0,0 +1,78 @@
+"""Unit tests for the OCR result cache."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+from snap_transact.cache import OCRCache
+from snap_transact.core import process_single_image
+from snap_transact.ocr import OCRProcessor
+from snap_transact.parser import TransactionParser
+
+
+class TestOCRCache:
+    """Test cases for the OCRCache class."""
+
+    def test_get_miss_returns_none(self):
+        """Test lookup of an unknown hash."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = OCRCache(Path(temp_dir) / "cache.db")
+
+            assert cache.get(b"unknown-hash") is None
+
+            cache.close()
+
+    def test_put_get_roundtrip(self):
+        """Test storing and retrieving an OCR result."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = OCRCache(Path(temp_dir) / "cache.db")
+
+            cache.put(b"some-hash", "Sample transaction text", 0.9)
+
+            assert cache.get(b"some-hash") == ("Sample transaction text", 0.9)
+
+            cache.close()
+
+    def test_results_persist_across_instances(self):
+        """Test that cached results survive reopening the database."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "cache.db"
+
+            cache = OCRCache(cache_path)
+            cache.put(b"some-hash", "Persisted text", 0.8)
+            cache.close()
+
+            reopened = OCRCache(cache_path)
+            assert reopened.get(b"some-hash") == ("Persisted text", 0.8)
+            reopened.close()
+
+    def test_hash_file_tracks_content(self):
+        """Test that the content hash changes with file content."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "image.png"
+
+            file_path.write_bytes(b"original content")
+            first = OCRCache.hash_file(file_path)
+            assert first == OCRCache.hash_file(file_path)
+
+            file_path.write_bytes(b"changed content")
+            assert OCRCache.hash_file(file_path) != first
+
+    def test_process_single_image_cache_hit_skips_ocr(self):
+        """Test that a cache hit avoids running OCR."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_path = Path(temp_dir) / "image.png"
+            image_path.write_bytes(b"fake image data")
+
+            cache = OCRCache(Path(temp_dir) / "cache.db")
+            cache.put(OCRCache.hash_file(image_path), "Amount: 250.000 VND", 0.9)
+
+            mock_ocr = Mock(spec=OCRProcessor)
+            parser = TransactionParser()
+
+            transactions = process_single_image(image_path, mock_ocr, parser, cache)
+
+            assert len(transactions) == 1
+            mock_ocr.extract_text_from_image.assert_not_called()
+
+            cache.close()
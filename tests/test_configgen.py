@@ -0,0 +1,95 @@
+"""Unit tests for the config compiler."""
+
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import yaml
+from pytest_mock import MockerFixture
+
+from snap_transact.configgen import compile_config, convert_config
+from snap_transact.utils import load_config
+
+
+class TestCompileConfig:
+    """Test cases for compile_config function."""
+
+    def test_compile_config_writes_module(self):
+        """Test that compilation emits an importable module literal."""
+        config_data = {"output_format": "csv", "ocr": {"language": "eng", "psm": 4}}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            config_path = temp_path / "config.yaml"
+            output_path = temp_path / "_config_compiled.py"
+            config_path.write_text(yaml.dump(config_data), encoding='utf-8')
+
+            result = compile_config(config_path, output_path)
+
+            assert result == output_path
+            namespace = {}
+            exec(output_path.read_text(encoding='utf-8'), namespace)
+            assert namespace["CONFIG_DICT"] == config_data
+
+    def test_compile_config_empty_file(self):
+        """Test that an empty config compiles to an empty dict."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            config_path = temp_path / "config.yaml"
+            output_path = temp_path / "_config_compiled.py"
+            config_path.write_text("", encoding='utf-8')
+
+            compile_config(config_path, output_path)
+
+            namespace = {}
+            exec(output_path.read_text(encoding='utf-8'), namespace)
+            assert namespace["CONFIG_DICT"] == {}
+
+    def test_load_config_prefers_compiled_module(self, mocker: MockerFixture):
+        """Test that load_config uses the compiled config when present."""
+        compiled = SimpleNamespace(CONFIG_DICT={"output_format": "json"})
+        mocker.patch("snap_transact.utils._config_compiled", compiled)
+
+        config = load_config()
+
+        assert config.output_format == "json"
+
+
+class TestConvertConfig:
+    """Test cases for convert_config function."""
+
+    def test_convert_config_writes_json_sidecar(self):
+        """Test that conversion emits an equivalent JSON file."""
+        import json
+
+        config_data = {"output_format": "csv", "log_level": "DEBUG"}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text(yaml.dump(config_data), encoding='utf-8')
+
+            result = convert_config(config_path)
+
+            assert result == config_path.with_suffix('.json')
+            assert json.loads(result.read_text(encoding='utf-8')) == config_data
+
+    def test_load_config_prefers_newer_json_sidecar(self, mocker: MockerFixture):
+        """Test that load_config takes the JSON fast path when available."""
+        import os
+
+        mocker.patch("snap_transact.utils.logger")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text(yaml.dump({"output_format": "csv"}), encoding='utf-8')
+
+            json_path = convert_config(config_path)
+            json_path.write_text('{"output_format": "json"}', encoding='utf-8')
+
+            # Make the sidecar strictly newer than the YAML
+            yaml_stat = os.stat(config_path)
+            os.utime(json_path, ns=(yaml_stat.st_atime_ns, yaml_stat.st_mtime_ns + 1))
+
+            config = load_config(config_path)
+
+            assert config.output_format == "json"
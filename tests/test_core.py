@@ -65,17 +65,15 @@ class TestCore:
         mock_ocr = Mock(spec=OCRProcessor)
         mock_parser = Mock(spec=TransactionParser)
         
-        mock_ocr.validate_image.return_value = True
         mock_ocr.extract_text_from_image.return_value = ("Sample transaction text", 0.9)
         mock_parser.parse_transaction_from_text.return_value = [self.sample_transaction]
-        
+
         image_path = Path("test_image.png")
         result = process_single_image(image_path, mock_ocr, mock_parser)
-        
+
         assert len(result) == 1
         assert result[0] == self.sample_transaction
-        
-        mock_ocr.validate_image.assert_called_once_with(image_path)
+
         mock_ocr.extract_text_from_image.assert_called_once_with(image_path)
         mock_parser.parse_transaction_from_text.assert_called_once_with(
             text="Sample transaction text",
@@ -88,21 +86,19 @@ class TestCore:
         mock_ocr = Mock(spec=OCRProcessor)
         mock_parser = Mock(spec=TransactionParser)
         
-        mock_ocr.validate_image.return_value = False
-        
+        mock_ocr.extract_text_from_image.side_effect = ValueError("invalid image: unsupported format GIF")
+
         image_path = Path("invalid_image.png")
         result = process_single_image(image_path, mock_ocr, mock_parser)
-        
+
         assert result == []
-        mock_ocr.validate_image.assert_called_once_with(image_path)
-        mock_ocr.extract_text_from_image.assert_not_called()
+        mock_parser.parse_transaction_from_text.assert_not_called()
 
     def test_process_single_image_no_text(self, mocker: MockerFixture):
         """Test processing image with no extractable text."""
         mock_ocr = Mock(spec=OCRProcessor)
         mock_parser = Mock(spec=TransactionParser)
         
-        mock_ocr.validate_image.return_value = True
         mock_ocr.extract_text_from_image.return_value = ("", 0.0)
         
         image_path = Path("empty_image.png")
@@ -117,14 +113,9 @@ class TestCore:
         mock_parser = Mock(spec=TransactionParser)
         mock_sentry = mocker.patch("snap_transact.core.sentry_sdk")
         
-        mock_ocr.validate_image.return_value = True
         mock_ocr.extract_text_from_image.side_effect = Exception("OCR failed")
-        
-        # Mock sentry hub
-        mock_hub = Mock()
-        mock_hub.client = Mock()
-        mock_sentry.Hub.current = mock_hub
-        
+        mocker.patch("snap_transact.core._SENTRY_ENABLED", True)
+
         image_path = Path("error_image.png")
         result = process_single_image(image_path, mock_ocr, mock_parser)
         
@@ -207,36 +198,53 @@ class TestCore:
     @patch('snap_transact.core.load_config')
     @patch('snap_transact.core.initialize_sentry')
     @patch('snap_transact.core.get_image_files')
-    @patch('snap_transact.core.process_single_image')
-    @patch('snap_transact.core.export_transactions_to_csv')
+    @patch('snap_transact.core.TransactionParser')
+    @patch('snap_transact.core.run_ocr_pipeline')
     def test_process_images_success(
         self,
-        mock_export,
-        mock_process_single,
+        mock_pipeline,
+        mock_parser_class,
         mock_get_files,
         mock_sentry,
         mock_load_config,
         mocker: MockerFixture
     ):
-        """Test successful image processing workflow."""
+        """Test successful image processing workflow via the OCR pipeline."""
         # Setup mocks
         mock_config = AppConfig(ocr=OCRSettings())
         mock_load_config.return_value = mock_config
-        mock_get_files.return_value = [Path("image1.png"), Path("image2.png")]
-        mock_process_single.return_value = [self.sample_transaction]
-        
+        image_files = [Path("image1.png"), Path("image2.png")]
+        mock_get_files.return_value = image_files
+        mock_pipeline.return_value = [
+            (image_files[0], "Sample transaction text", 0.9, None),
+            (image_files[1], "Sample transaction text", 0.9, None),
+        ]
+        mock_parser_class.return_value.parse_transaction_from_text.return_value = [
+            self.sample_transaction
+        ]
+
         input_path = Path("input")
-        output_path = Path("output.csv")
-        
-        result = process_images(input_path, output_path)
-        
-        # Verify calls
-        mock_load_config.assert_called_once_with(None)
-        mock_sentry.assert_called_once_with(mock_config.sentry_dsn)
-        mock_get_files.assert_called_once_with(input_path, mock_config.supported_formats)
-        assert mock_process_single.call_count == 2
-        mock_export.assert_called_once()
-        
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "output.csv"
+
+            result = process_images(input_path, output_path, workers=1)
+
+            # Verify calls
+            mock_load_config.assert_called_once_with(None)
+            mock_sentry.assert_called_once_with(mock_config.sentry_dsn)
+            mock_get_files.assert_called_once_with(
+                input_path,
+                mock_config.supported_formats,
+                mock_config.sort_by_inode,
+                mock_config.warm_page_cache,
+            )
+            mock_pipeline.assert_called_once()
+
+            # Transactions are streamed straight to the CSV
+            df = pd.read_csv(output_path)
+            assert len(df) == 2
+
         # Verify result
         assert isinstance(result, ProcessingResult)
         assert result.processed_count == 2
@@ -261,10 +269,12 @@ class TestCore:
 
     @patch('snap_transact.core.load_config')
     @patch('snap_transact.core.get_image_files')
-    @patch('snap_transact.core.process_single_image')
+    @patch('snap_transact.core.TransactionParser')
+    @patch('snap_transact.core.run_ocr_pipeline')
     def test_process_images_with_failures(
         self,
-        mock_process_single,
+        mock_pipeline,
+        mock_parser_class,
         mock_get_files,
         mock_load_config,
         mocker: MockerFixture
@@ -272,25 +282,78 @@ class TestCore:
         """Test processing with some failed images."""
         mock_config = AppConfig(ocr=OCRSettings())
         mock_load_config.return_value = mock_config
-        mock_get_files.return_value = [Path("image1.png"), Path("image2.png")]
-        
-        # First image succeeds, second fails
-        mock_process_single.side_effect = [
-            [self.sample_transaction],
-            Exception("Processing failed")
+        image_files = [Path("image1.png"), Path("image2.png")]
+        mock_get_files.return_value = image_files
+
+        # First image succeeds, second fails inside the pipeline
+        mock_pipeline.return_value = [
+            (image_files[0], "Sample transaction text", 0.9, None),
+            (image_files[1], "", 0.0, Exception("Processing failed")),
         ]
-        
+        mock_parser_class.return_value.parse_transaction_from_text.return_value = [
+            self.sample_transaction
+        ]
+
         # Mock sentry
         mock_sentry = mocker.patch("snap_transact.core.sentry_sdk")
-        mock_hub = Mock()
-        mock_hub.client = Mock()
-        mock_sentry.Hub.current = mock_hub
-        
+        mocker.patch("snap_transact.core._SENTRY_ENABLED", True)
+
         input_path = Path("input")
-        output_path = Path("output.csv")
-        
-        result = process_images(input_path, output_path)
-        
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "output.csv"
+
+            result = process_images(input_path, output_path, workers=1)
+
         assert result.processed_count == 1
         assert result.transaction_count == 1
-        assert result.failed_count == 1 
\ No newline at end of file
+        assert result.failed_count == 1
+        mock_sentry.capture_exception.assert_called_once()
+
+    @patch('snap_transact.core.load_config')
+    @patch('snap_transact.core.get_image_files')
+    @patch('snap_transact.core._process_image_worker')
+    @patch('snap_transact.core.ProcessPoolExecutor')
+    def test_process_images_parallel(
+        self,
+        mock_executor_class,
+        mock_worker,
+        mock_get_files,
+        mock_load_config,
+    ):
+        """Test parallel image processing dispatches to worker processes."""
+        from concurrent.futures import Future
+
+        mock_config = AppConfig(ocr=OCRSettings())
+        mock_load_config.return_value = mock_config
+        mock_get_files.return_value = [Path("image1.png"), Path("image2.png")]
+        mock_worker.return_value = [self.sample_transaction]
+
+        # Fake executor that runs submissions inline in this process
+        def inline_submit(fn, *args, **kwargs):
+            future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        mock_executor = Mock()
+        mock_executor.submit.side_effect = inline_submit
+        mock_executor_class.return_value.__enter__ = Mock(return_value=mock_executor)
+        mock_executor_class.return_value.__exit__ = Mock(return_value=False)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "output.csv"
+
+            result = process_images(Path("input"), output_path, workers=2)
+
+            mock_executor_class.assert_called_once_with(max_workers=2)
+            assert mock_worker.call_count == 2
+
+            df = pd.read_csv(output_path)
+            assert len(df) == 2
+
+        assert result.processed_count == 2
+        assert result.transaction_count == 2
+        assert result.failed_count == 0 
\ No newline at end of file
@@ -80,7 +80,7 @@ class TestIntegration:
                 
                 assert result.exit_code == 0
                 mock_process_images.assert_called_once_with(
-                    temp_path, output_path, None
+                    temp_path, output_path, None, None
                 )
                 
             finally:
@@ -217,7 +217,6 @@ class TestIntegration:
         
         # Mock OCR processor
         mock_ocr = Mock()
-        mock_ocr.validate_image.return_value = True
         mock_ocr.extract_text_from_image.return_value = ("Transaction text", 0.9)
         mock_ocr_class.return_value = mock_ocr
         
@@ -1,346 +1,374 @@
-"""Unit tests for the OCR module."""
-
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-
-import pytest
-from PIL import Image
-from pytest_mock import MockerFixture
-
-from snap_transact.ocr import OCRProcessor
-from snap_transact.models import OCRSettings
-
-
-class TestOCRProcessor:
-    """Test cases for OCRProcessor class."""
-
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.settings = OCRSettings(
-            language="eng+vie",
-            oem=3,
-            psm=6,
-            dpi=300,
-            preprocess=True
-        )
-        self.processor = OCRProcessor(self.settings)
-
-    def test_init(self, mocker: MockerFixture):
-        """Test OCRProcessor initialization."""
-        mock_logger = mocker.patch("snap_transact.ocr.logger")
-        settings = OCRSettings()
-        
-        processor = OCRProcessor(settings)
-        
-        assert processor.settings == settings
-        mock_logger.debug.assert_called_once()
-
-    def test_preprocess_image_enabled(self):
-        """Test image preprocessing when enabled."""
-        # Create a simple test image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            # Create a test image
-            test_image = Image.new('RGB', (100, 100), color='white')
-            test_image.save(temp_path)
-            
-            # Load and preprocess
-            with Image.open(temp_path) as image:
-                processed = self.processor.preprocess_image(image)
-                
-            assert processed.mode == 'L'  # Should be grayscale
-            assert processed.size == (100, 100)
-            
-        finally:
-            # Clean up
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_preprocess_image_disabled(self):
-        """Test image preprocessing when disabled."""
-        settings = OCRSettings(preprocess=False)
-        processor = OCRProcessor(settings)
-        
-        # Create a test image
-        test_image = Image.new('RGB', (100, 100), color='white')
-        
-        processed = processor.preprocess_image(test_image)
-        
-        # Should return original image unchanged
-        assert processed is test_image
-
-    def test_preprocess_image_grayscale_input(self):
-        """Test preprocessing with grayscale input."""
-        # Create a grayscale test image
-        test_image = Image.new('L', (100, 100), color=128)
-        
-        processed = self.processor.preprocess_image(test_image)
-        
-        assert processed.mode == 'L'
-        assert processed.size == (100, 100)
-
-    @patch('snap_transact.ocr.pytesseract.image_to_string')
-    @patch('snap_transact.ocr.pytesseract.image_to_data')
-    def test_extract_text_from_image_success(self, mock_image_to_data, mock_image_to_string):
-        """Test successful text extraction from image."""
-        # Create a test image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            test_image = Image.new('RGB', (200, 100), color='white')
-            test_image.save(temp_path)
-            
-            # Mock Tesseract responses
-            mock_image_to_string.return_value = "Sample transaction text"
-            mock_image_to_data.return_value = {
-                'conf': ['90', '85', '95', '80', '92']
-            }
-            
-            text, confidence = self.processor.extract_text_from_image(temp_path)
-            
-            assert text == "Sample transaction text"
-            assert confidence == 0.904  # (90+85+95+80+92)/5 = 90.4 -> 0.904
-            
-            # Verify Tesseract was called with correct config
-            expected_config = '--oem 3 --psm 6 -l eng+vie'
-            mock_image_to_string.assert_called_once()
-            mock_image_to_data.assert_called_once()
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    @patch('snap_transact.ocr.pytesseract.image_to_string')
-    @patch('snap_transact.ocr.pytesseract.image_to_data')
-    def test_extract_text_from_image_large_image(self, mock_image_to_data, mock_image_to_string):
-        """Test text extraction with large image (should be resized)."""
-        # Create a large test image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            large_image = Image.new('RGB', (3000, 2500), color='white')
-            large_image.save(temp_path)
-            
-            mock_image_to_string.return_value = "Large image text"
-            mock_image_to_data.return_value = {'conf': ['90']}
-            
-            text, confidence = self.processor.extract_text_from_image(temp_path)
-            
-            assert text == "Large image text"
-            assert confidence == 0.90
-            
-            # Verify image was processed (resized)
-            mock_image_to_string.assert_called_once()
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    @patch('snap_transact.ocr.pytesseract.image_to_string')
-    @patch('snap_transact.ocr.pytesseract.image_to_data')
-    def test_extract_text_confidence_error(self, mock_image_to_data, mock_image_to_string, mocker: MockerFixture):
-        """Test text extraction when confidence data extraction fails."""
-        # Create a test image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            test_image = Image.new('RGB', (200, 100), color='white')
-            test_image.save(temp_path)
-            
-            mock_image_to_string.return_value = "Sample text"
-            mock_image_to_data.side_effect = Exception("Confidence extraction failed")
-            
-            mock_logger = mocker.patch("snap_transact.ocr.logger")
-            
-            text, confidence = self.processor.extract_text_from_image(temp_path)
-            
-            assert text == "Sample text"
-            assert confidence == 0.0
-            mock_logger.warning.assert_called_once()
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    @patch('snap_transact.ocr.pytesseract.image_to_string')
-    def test_extract_text_from_image_ocr_error(self, mock_image_to_string):
-        """Test text extraction when OCR fails."""
-        # Create a test image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            test_image = Image.new('RGB', (200, 100), color='white')
-            test_image.save(temp_path)
-            
-            mock_image_to_string.side_effect = Exception("OCR failed")
-            
-            with pytest.raises(Exception, match="OCR failed"):
-                self.processor.extract_text_from_image(temp_path)
-                
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_validate_image_success(self):
-        """Test successful image validation."""
-        # Create a valid test image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            test_image = Image.new('RGB', (200, 100), color='white')
-            test_image.save(temp_path)
-            
-            result = self.processor.validate_image(temp_path)
-            assert result is True
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_validate_image_file_not_exists(self, mocker: MockerFixture):
-        """Test image validation when file doesn't exist."""
-        mock_logger = mocker.patch("snap_transact.ocr.logger")
-        
-        non_existent_path = Path("non_existent_image.png")
-        result = self.processor.validate_image(non_existent_path)
-        
-        assert result is False
-        mock_logger.warning.assert_called_once_with(f"Image file does not exist: {non_existent_path}")
-
-    def test_validate_image_too_large(self, mocker: MockerFixture):
-        """Test image validation when file is too large."""
-        mock_logger = mocker.patch("snap_transact.ocr.logger")
-        
-        # Create a temporary file and mock its size
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            # Create a small image but mock the file size
-            test_image = Image.new('RGB', (100, 100), color='white')
-            test_image.save(temp_path)
-            
-            # Mock stat to return large file size
-            mock_stat = mocker.patch.object(temp_path, 'stat')
-            mock_stat.return_value.st_size = 15_000_000  # 15MB
-            
-            result = self.processor.validate_image(temp_path)
-            
-            assert result is False
-            mock_logger.warning.assert_called_once_with(f"Image file too large: 15000000 bytes")
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_validate_image_unsupported_format(self, mocker: MockerFixture):
-        """Test image validation with unsupported format."""
-        mock_logger = mocker.patch("snap_transact.ocr.logger")
-        
-        # Create a test image with unsupported format
-        with tempfile.NamedTemporaryFile(suffix='.gif', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            # Create a GIF image (unsupported format)
-            test_image = Image.new('RGB', (100, 100), color='white')
-            test_image.save(temp_path, format='GIF')
-            
-            result = self.processor.validate_image(temp_path)
-            
-            assert result is False
-            mock_logger.warning.assert_called_once_with("Unsupported image format: GIF")
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_validate_image_too_small(self, mocker: MockerFixture):
-        """Test image validation when image is too small."""
-        mock_logger = mocker.patch("snap_transact.ocr.logger")
-        
-        # Create a very small test image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-        
-        try:
-            test_image = Image.new('RGB', (30, 30), color='white')  # Too small
-            test_image.save(temp_path)
-            
-            result = self.processor.validate_image(temp_path)
-            
-            assert result is False
-            mock_logger.warning.assert_called_once_with("Image too small: (30, 30)")
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_validate_image_corrupted_file(self, mocker: MockerFixture):
-        """Test image validation with corrupted file."""
-        mock_logger = mocker.patch("snap_transact.ocr.logger")
-        
-        # Create a corrupted file
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-            temp_file.write(b"This is not a valid image file")
-        
-        try:
-            result = self.processor.validate_image(temp_path)
-            
-            assert result is False
-            mock_logger.error.assert_called_once()
-            
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_settings_configuration(self):
-        """Test different OCR settings configurations."""
-        custom_settings = OCRSettings(
-            language="eng",
-            oem=1,
-            psm=8,
-            dpi=600,
-            preprocess=False
-        )
-        
-        processor = OCRProcessor(custom_settings)
-        
-        assert processor.settings.language == "eng"
-        assert processor.settings.oem == 1
-        assert processor.settings.psm == 8
-        assert processor.settings.dpi == 600
-        assert processor.settings.preprocess is False
-
-    @patch('snap_transact.ocr.pytesseract.image_to_data')
-    def test_confidence_calculation_empty_list(self, mock_image_to_data):
-        """Test confidence calculation with empty confidence list."""
-        mock_image_to_data.return_value = {'conf': []}
-        
-        # This should be tested within extract_text_from_image
-        # but we can test the logic separately
-        confidences = []
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-        
-        assert avg_confidence == 0.0
-
-    @patch('snap_transact.ocr.pytesseract.image_to_data')
-    def test_confidence_calculation_with_negative_values(self, mock_image_to_data):
-        """Test confidence calculation filtering negative values."""
-        mock_image_to_data.return_value = {'conf': ['90', '-1', '85', '0', '95']}
-        
-        # Simulate the filtering logic from the actual code
-        confidences = [int(conf) for conf in ['90', '-1', '85', '0', '95'] if int(conf) > 0]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-        
-        assert confidences == [90, 85, 95]
+"""Unit tests for the OCR module."""
+
+import io
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock, patch, MagicMock
+
+import pytest
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from snap_transact.ocr import OCRProcessor
+from snap_transact.models import OCRSettings
+
+
+@pytest.fixture(scope="module")
+def sample_png(tmp_path_factory):
+    """A plain valid PNG shared by tests that only need any readable image."""
+    path = tmp_path_factory.mktemp("ocr") / "sample.png"
+    # Store-only PNG: nothing here needs DEFLATE spent on a blank buffer
+    Image.new('RGB', (200, 100), color='white').save(path, compress_level=0)
+    return path
+
+
+class TestOCRProcessor:
+    """Test cases for OCRProcessor class."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.settings = OCRSettings(
+            language="eng+vie",
+            oem=3,
+            psm=6,
+            dpi=300,
+            preprocess=True
+        )
+        self.processor = OCRProcessor(self.settings)
+
+    @pytest.fixture(autouse=True)
+    def _mock_logger(self, mocker: MockerFixture):
+        """Patch the module logger once per test instead of per call site."""
+        self.mock_logger = mocker.patch("snap_transact.ocr.logger")
+
+    def test_init(self):
+        """Test OCRProcessor initialization."""
+        settings = OCRSettings()
+
+        processor = OCRProcessor(settings)
+
+        assert processor.settings == settings
+        self.mock_logger.debug.assert_called_once()
+
+    def test_preprocess_image_enabled(self, sample_png):
+        """Test image preprocessing when enabled."""
+        with Image.open(sample_png) as image:
+            processed = self.processor.preprocess_image(image)
+
+        assert processed.mode == 'L'  # Should be grayscale
+        assert processed.size == (200, 100)
+
+    def test_preprocess_image_disabled(self):
+        """Test image preprocessing when disabled."""
+        settings = OCRSettings(preprocess=False)
+        processor = OCRProcessor(settings)
+        
+        # Create a test image
+        test_image = Image.new('RGB', (100, 100), color='white')
+        
+        processed = processor.preprocess_image(test_image)
+        
+        # Should return original image unchanged
+        assert processed is test_image
+
+    def test_preprocess_adaptive_threshold(self):
+        """Test that binarize produces a pure black/white image."""
+        import numpy as np
+
+        settings = OCRSettings(preprocess=True, binarize=True)
+        processor = OCRProcessor(settings)
+        test_image = Image.new('L', (100, 100), color=128)
+
+        processed = processor.preprocess_image(test_image)
+
+        assert processed.mode == 'L'
+        assert processed.size == (100, 100)
+        assert set(np.asarray(processed).flatten().tolist()) <= {0, 255}
+
+    def test_preprocess_image_grayscale_input(self):
+        """Test preprocessing with grayscale input."""
+        # Create a grayscale test image
+        test_image = Image.new('L', (100, 100), color=128)
+        
+        processed = self.processor.preprocess_image(test_image)
+        
+        assert processed.mode == 'L'
+        assert processed.size == (100, 100)
+
+    @patch('snap_transact.ocr.pytesseract.image_to_string')
+    @patch('snap_transact.ocr.pytesseract.image_to_data')
+    def test_extract_text_from_image_success(self, mock_image_to_data, mock_image_to_string, sample_png):
+        """Test successful text extraction from image."""
+        # Mock Tesseract word-level output
+        mock_image_to_data.return_value = {
+            'text': ['Sample', 'transaction', 'text', '', ''],
+            'block_num': [1, 1, 1, 1, 1],
+            'par_num': [1, 1, 1, 1, 1],
+            'line_num': [1, 1, 1, 1, 1],
+            'conf': ['90', '85', '95', '-1', '-1'],
+        }
+
+        text, confidence = self.processor.extract_text_from_image(sample_png)
+
+        assert text == "Sample transaction text"
+        assert confidence == 0.90  # (90+85+95)/3 = 90 -> 0.90
+
+        # Text and confidence come from a single Tesseract pass
+        mock_image_to_data.assert_called_once()
+        mock_image_to_string.assert_not_called()
+
+    @patch('snap_transact.ocr.pytesseract.image_to_string')
+    @patch('snap_transact.ocr.pytesseract.image_to_data')
+    def test_extract_text_from_image_large_image(self, mock_image_to_data, mock_image_to_string):
+        """Test text extraction with large image (should be resized)."""
+        # Create a large test image
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
+        
+        try:
+            large_image = Image.new('RGB', (3000, 2500), color='white')
+            large_image.save(temp_path)
+
+            mock_image_to_data.return_value = {
+                'text': ['Large', 'image', 'text'],
+                'block_num': [1, 1, 1],
+                'par_num': [1, 1, 1],
+                'line_num': [1, 1, 1],
+                'conf': ['90', '90', '90'],
+            }
+
+            text, confidence = self.processor.extract_text_from_image(temp_path)
+
+            assert text == "Large image text"
+            assert confidence == 0.90
+
+            # Verify the image handed to OCR was downscaled to 2000px
+            mock_image_to_data.assert_called_once()
+            ocr_image = mock_image_to_data.call_args[0][0]
+            assert max(ocr_image.size) == 2000
+
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    @patch('snap_transact.ocr.pytesseract.image_to_string')
+    @patch('snap_transact.ocr.pytesseract.image_to_data')
+    def test_extract_text_confidence_error(self, mock_image_to_data, mock_image_to_string, sample_png):
+        """Test text extraction when confidence data extraction fails."""
+        mock_image_to_string.return_value = "Sample text"
+        mock_image_to_data.side_effect = Exception("Confidence extraction failed")
+
+        text, confidence = self.processor.extract_text_from_image(sample_png)
+
+        assert text == "Sample text"
+        assert confidence == 0.0
+        self.mock_logger.warning.assert_called_once()
+
+    @patch('snap_transact.ocr.pytesseract.image_to_string')
+    def test_extract_text_from_image_ocr_error(self, mock_image_to_string, sample_png):
+        """Test text extraction when OCR fails."""
+        mock_image_to_string.side_effect = Exception("OCR failed")
+
+        with pytest.raises(Exception, match="OCR failed"):
+            self.processor.extract_text_from_image(sample_png)
+
+    def test_validate_image_success(self, sample_png):
+        """Test successful image validation."""
+        result = self.processor.validate_image(sample_png)
+        assert result is True
+
+    def test_validate_image_file_not_exists(self):
+        """Test image validation when file doesn't exist."""
+        non_existent_path = Path("non_existent_image.png")
+        result = self.processor.validate_image(non_existent_path)
+        
+        assert result is False
+        self.mock_logger.warning.assert_called_once_with(f"Image file does not exist: {non_existent_path}")
+
+    def test_validate_image_too_large(self, mocker: MockerFixture, sample_png):
+        """Test image validation when file is too large."""
+        # Lower the limit below any real PNG instead of faking stat results
+        mocker.patch("snap_transact.ocr.MAX_IMAGE_BYTES", 100)
+        file_size = sample_png.stat().st_size
+
+        result = self.processor.validate_image(sample_png)
+
+        assert result is False
+        self.mock_logger.warning.assert_called_once_with(f"Image file too large: {file_size} bytes")
+
+    def test_validate_image_unsupported_format(self):
+        """Test image validation with unsupported format."""
+        # Create a test image with unsupported format
+        with tempfile.NamedTemporaryFile(suffix='.gif', delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
+        
+        try:
+            # Create a GIF image (unsupported format)
+            test_image = Image.new('RGB', (100, 100), color='white')
+            test_image.save(temp_path, format='GIF')
+            
+            result = self.processor.validate_image(temp_path)
+            
+            assert result is False
+            self.mock_logger.warning.assert_called_once_with("Unsupported image format: GIF")
+            
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def test_validate_image_too_small(self):
+        """Test image validation when image is too small."""
+        # Create a very small test image
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
+        
+        try:
+            test_image = Image.new('RGB', (30, 30), color='white')  # Too small
+            test_image.save(temp_path)
+            
+            result = self.processor.validate_image(temp_path)
+            
+            assert result is False
+            self.mock_logger.warning.assert_called_once_with("Image too small: (30, 30)")
+            
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def test_validate_image_corrupted_file(self):
+        """Test image validation with corrupted data."""
+        result = self.processor.validate_image(io.BytesIO(b"This is not a valid image file"))
+
+        assert result is False
+        self.mock_logger.error.assert_called_once()
+
+    def test_extract_text_uses_tesserocr_when_available(self, mocker: MockerFixture):
+        """Test that the in-process tesserocr API is preferred when installed."""
+        mock_tesserocr = mocker.patch("snap_transact.ocr.tesserocr")
+        mock_api = mock_tesserocr.PyTessBaseAPI.return_value
+        mock_api.GetUTF8Text.return_value = "In-process text\n"
+        mock_api.MeanTextConf.return_value = 87
+
+        processor = OCRProcessor(OCRSettings())
+        test_image = Image.new('L', (100, 100), color=128)
+
+        text, confidence = processor.extract_text(test_image)
+
+        assert text == "In-process text"
+        assert confidence == 0.87
+        mock_api.SetImage.assert_called_once_with(test_image)
+
+    @patch('snap_transact.ocr.pytesseract.image_to_data')
+    def test_extract_text_from_image_pixel_cache(self, mock_image_to_data):
+        """Test that identical preprocessed images only run OCR once."""
+        mock_image_to_data.return_value = {
+            'text': ['Cached', 'text'],
+            'block_num': [1, 1],
+            'par_num': [1, 1],
+            'line_num': [1, 1],
+            'conf': ['90', '90'],
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            first_path = temp_path / "first.png"
+            duplicate_path = temp_path / "duplicate.png"
+            different_path = temp_path / "different.png"
+            Image.new('RGB', (200, 100), color='white').save(first_path)
+            Image.new('RGB', (200, 100), color='white').save(duplicate_path)
+            Image.new('RGB', (200, 100), color='black').save(different_path)
+
+            first = self.processor.extract_text_from_image(first_path)
+            duplicate = self.processor.extract_text_from_image(duplicate_path)
+
+            assert first == duplicate == ("Cached text", 0.90)
+            mock_image_to_data.assert_called_once()
+
+            self.processor.extract_text_from_image(different_path)
+            assert mock_image_to_data.call_count == 2
+
+    @patch('snap_transact.ocr.pytesseract.image_to_data')
+    def test_extract_text_batch_preserves_order(self, mock_image_to_data, mocker: MockerFixture):
+        """Test batch extraction over several images."""
+        mocker.patch("snap_transact.ocr._BATCH_WORKERS", 2)
+        mock_image_to_data.return_value = {
+            'text': ['Batch', 'text'],
+            'block_num': [1, 1],
+            'par_num': [1, 1],
+            'line_num': [1, 1],
+            'conf': ['90', '90'],
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            image_paths = []
+            for index in range(4):
+                image_path = temp_path / f"image{index}.png"
+                # Distinct pixels per image so the pixel cache cannot collapse them
+                Image.new('RGB', (200, 100), color=(index * 60, index * 60, index * 60)).save(image_path)
+                image_paths.append(image_path)
+
+            results = self.processor.extract_text_batch(image_paths)
+
+            assert len(results) == 4
+            assert all(text == "Batch text" for text, _ in results)
+            assert all(confidence == 0.90 for _, confidence in results)
+            assert mock_image_to_data.call_count == 4
+
+    def test_extract_text_batch_empty_list(self):
+        """Test batch extraction with no images."""
+        assert self.processor.extract_text_batch([]) == []
+
+    def test_close_releases_tesserocr_api(self, mocker: MockerFixture):
+        """Test that close ends the in-process engine."""
+        mock_tesserocr = mocker.patch("snap_transact.ocr.tesserocr")
+        mock_api = mock_tesserocr.PyTessBaseAPI.return_value
+
+        processor = OCRProcessor(OCRSettings())
+        processor.close()
+
+        mock_api.End.assert_called_once()
+        processor.close()  # Idempotent
+        mock_api.End.assert_called_once()
+
+    def test_settings_configuration(self):
+        """Test different OCR settings configurations."""
+        custom_settings = OCRSettings(
+            language="eng",
+            oem=1,
+            psm=8,
+            dpi=600,
+            preprocess=False
+        )
+        
+        processor = OCRProcessor(custom_settings)
+        
+        assert processor.settings.language == "eng"
+        assert processor.settings.oem == 1
+        assert processor.settings.psm == 8
+        assert processor.settings.dpi == 600
+        assert processor.settings.preprocess is False
+
+    @patch('snap_transact.ocr.pytesseract.image_to_data')
+    def test_confidence_calculation_empty_list(self, mock_image_to_data):
+        """Test confidence calculation with empty confidence list."""
+        mock_image_to_data.return_value = {'conf': []}
+        
+        # This should be tested within extract_text_from_image
+        # but we can test the logic separately
+        confidences = []
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        
+        assert avg_confidence == 0.0
+
+    @patch('snap_transact.ocr.pytesseract.image_to_data')
+    def test_confidence_calculation_with_negative_values(self, mock_image_to_data):
+        """Test confidence calculation filtering negative values."""
+        mock_image_to_data.return_value = {'conf': ['90', '-1', '85', '0', '95']}
+        
+        # Simulate the filtering logic from the actual code
+        confidences = [int(conf) for conf in ['90', '-1', '85', '0', '95'] if int(conf) > 0]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        
+        assert confidences == [90, 85, 95]
         assert avg_confidence == 90.0 
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""Unit tests for the OCR preprocessing kernel."""
+
+import numpy as np
+
+from snap_transact.ocr_kernels import preprocess
+
+
+class TestPreprocess:
+    """Test cases for the fused preprocessing kernel."""
+
+    def test_preprocess_preserves_shape_and_dtype(self):
+        """Test that output shape and dtype match the input."""
+        image = np.full((50, 80), 128, dtype=np.uint8)
+
+        result = preprocess(image)
+
+        assert result.shape == (50, 80)
+        assert result.dtype == np.uint8
+
+    def test_preprocess_uniform_image_unchanged(self):
+        """Test that a uniform image stays uniform."""
+        image = np.full((40, 40), 200, dtype=np.uint8)
+
+        result = preprocess(image)
+
+        assert np.all(result == 200)
+
+    def test_preprocess_increases_contrast(self):
+        """Test that contrast between dark and light regions grows."""
+        image = np.full((40, 40), 120, dtype=np.uint8)
+        image[:, 20:] = 140
+
+        result = preprocess(image)
+
+        original_range = 140 - 120
+        result_range = int(result.max()) - int(result.min())
+        assert result_range > original_range
+
+    def test_preprocess_removes_salt_noise(self):
+        """Test that isolated noise pixels are filtered out."""
+        image = np.full((40, 40), 128, dtype=np.uint8)
+        image[10, 10] = 255  # Single salt pixel
+
+        result = preprocess(image)
+
+        assert result[10, 10] < 255
+        assert abs(int(result[10, 10]) - int(result[0, 0])) < 50
+
+    def test_preprocess_clips_to_valid_range(self):
+        """Test that extreme values stay within uint8 bounds."""
+        image = np.zeros((40, 40), dtype=np.uint8)
+        image[:, 20:] = 255
+
+        result = preprocess(image)
+
+        assert result.min() >= 0
+        assert result.max() <= 255
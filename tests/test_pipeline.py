@@ -0,0 +1,114 @@
+"""Unit tests for the OCR pipeline module."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from snap_transact.pipeline import run_ocr_pipeline
+from snap_transact.ocr import OCRProcessor
+
+
+class TestRunOCRPipeline:
+    """Test cases for run_ocr_pipeline function."""
+
+    def _make_processor(self) -> Mock:
+        """Create a mock OCR processor with pass-through behaviour."""
+        processor = Mock(spec=OCRProcessor)
+        processor.preprocess_image.side_effect = lambda image: image
+        processor.extract_text.return_value = ("Sample transaction text", 0.9)
+        return processor
+
+    def test_run_pipeline_empty_list(self):
+        """Test pipeline with no images."""
+        processor = self._make_processor()
+
+        result = run_ocr_pipeline([], processor)
+
+        assert result == []
+        processor.extract_text.assert_not_called()
+
+    def test_run_pipeline_preserves_input_order(self):
+        """Test that results come back in input order."""
+        processor = self._make_processor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            image_files = []
+            for name in ["b.png", "a.png", "c.png"]:
+                image_path = temp_path / name
+                Image.new('RGB', (100, 100), color='white').save(image_path)
+                image_files.append(image_path)
+
+            result = run_ocr_pipeline(image_files, processor)
+
+            assert [path for path, _, _, _ in result] == image_files
+            assert all(text == "Sample transaction text" for _, text, _, _ in result)
+            assert all(confidence == 0.9 for _, _, confidence, _ in result)
+            assert all(error is None for _, _, _, error in result)
+
+    def test_run_pipeline_invalid_image_yields_empty_result(self):
+        """Test that invalid images produce empty text plus the error."""
+        processor = self._make_processor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_path = Path(temp_dir) / "image.png"
+            Image.new('RGB', (30, 30), color='white').save(image_path)  # Below minimum dimensions
+
+            result = run_ocr_pipeline([image_path], processor)
+
+            assert len(result) == 1
+            path, text, confidence, error = result[0]
+            assert (path, text, confidence) == (image_path, "", 0.0)
+            assert isinstance(error, ValueError)
+            processor.extract_text.assert_not_called()
+
+    def test_run_pipeline_unreadable_file_yields_empty_result(self, mocker: MockerFixture):
+        """Test that unreadable files are logged and skipped."""
+        mock_logger = mocker.patch("snap_transact.pipeline.logger")
+        processor = self._make_processor()
+
+        missing_path = Path("missing_image.png")
+        result = run_ocr_pipeline([missing_path], processor)
+
+        assert len(result) == 1
+        path, text, confidence, error = result[0]
+        assert (path, text, confidence) == (missing_path, "", 0.0)
+        assert isinstance(error, OSError)
+        mock_logger.error.assert_called_once()
+
+    def test_run_pipeline_ocr_error_yields_empty_result(self, mocker: MockerFixture):
+        """Test that OCR failures produce empty text for that image."""
+        mock_logger = mocker.patch("snap_transact.pipeline.logger")
+        processor = self._make_processor()
+        processor.extract_text.side_effect = Exception("OCR failed")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_path = Path(temp_dir) / "image.png"
+            Image.new('RGB', (100, 100), color='white').save(image_path)
+
+            result = run_ocr_pipeline([image_path], processor)
+
+            assert len(result) == 1
+            path, text, confidence, error = result[0]
+            assert (path, text, confidence) == (image_path, "", 0.0)
+            assert isinstance(error, Exception)
+            mock_logger.error.assert_called_once()
+
+    def test_run_pipeline_resizes_large_images(self):
+        """Test that oversized images are resized before preprocessing."""
+        processor = self._make_processor()
+        seen_sizes = []
+        processor.preprocess_image.side_effect = lambda image: seen_sizes.append(image.size) or image
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_path = Path(temp_dir) / "large.png"
+            Image.new('RGB', (3000, 2500), color='white').save(image_path)
+
+            run_ocr_pipeline([image_path], processor)
+
+            assert len(seen_sizes) == 1
+            assert seen_sizes[0][0] <= 2000
+            assert seen_sizes[0][1] <= 2000